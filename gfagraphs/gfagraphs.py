@@ -2,17 +2,28 @@
 from os import stat
 from os.path import exists
 from enum import Enum
-from re import sub, match
-from typing import Callable
+from abc import ABCMeta
+from string import ascii_letters, ascii_uppercase
+from typing import Callable, Iterator
 from copy import deepcopy
 from json import loads, dumps
-from itertools import chain
+from itertools import islice, pairwise
 from networkx import MultiDiGraph, DiGraph
 from tharospytools.matplotlib_tools import get_palette
 from warnings import warn
+from gzip import open as gz_open
 
 warn("The lib gfagraphs is now deprecated. Please move your program to use pgGraphs (also included in the lib) as delepoppement efforts goes into it.")
 
+# Allowed chars for the 'XX:Y:' prefix of optional tags
+_TAG_NAME_CHARS: frozenset = frozenset(ascii_uppercase)
+_TAG_TYPE_CHARS: frozenset = frozenset(ascii_letters)
+# Size of the blocks read from disk when loading a graph
+_READ_BLOCK_SIZE: int = 1 << 20
+# Size of the write buffer, and number of lines written at once when saving a graph
+_WRITE_BUFFER_SIZE: int = 1 << 20
+_WRITE_BATCH_SIZE: int = 4096
+
 
 def get_gfa_subtype(gfa_file_path: str | list[str]) -> str | list[str]:
     """Given a file, or more, returns the gfa subtypes, and raises error if file is invalid or does not exists
@@ -33,7 +44,7 @@ def get_gfa_subtype(gfa_file_path: str | list[str]) -> str | list[str]:
                 "Specified file does not exists. Please check provided path."
             )
         # Checking if file descriptor is valid
-        if not gfa_file.endswith('.gfa'):
+        if not gfa_file.endswith('.gfa') and not gfa_file.endswith('.gfa.gz'):
             raise IOError(
                 "File descriptor is invalid. Please check format, this lib is designed to work with Graphical Fragment Assembly (GFA) files."
             )
@@ -42,7 +53,7 @@ def get_gfa_subtype(gfa_file_path: str | list[str]) -> str | list[str]:
             raise IOError(
                 "File is empty."
             )
-        with open(gfa_file, 'r', encoding='utf-8') as gfa_reader:
+        with open(gfa_file, 'r', encoding='utf-8') if gfa_file.endswith('.gfa') else gz_open(gfa_file, 'rt', encoding='utf-8') as gfa_reader:
             header: str = gfa_reader.readline()
             if header[0] != 'H':
                 styles.append('rGFA')
@@ -94,6 +105,10 @@ def gtype(tag_type: str) -> type | Callable:
     raise ValueError(f"Type identifier {tag_type} is not in the GFA standard")
 
 
+# GFA type identifiers of the most common tag value types
+_DTYPE: dict[type, str] = {int: 'i', float: 'f', str: 'Z'}
+
+
 def dtype(data: object) -> str:
     """Interprets tags of GFA as a Python-compatible format
 
@@ -107,6 +122,9 @@ def dtype(data: object) -> str:
     Returns:
         type | Callable: the cast method or type to apply
     """
+    # Fast path on exact type, subclasses (such as bool) go through checks below
+    if (type_identifier := _DTYPE.get(type(data))) is not None:
+        return type_identifier
     if isinstance(data, int):
         return 'i'
     elif isinstance(data, float):
@@ -122,21 +140,23 @@ def dtype(data: object) -> str:
                 f"Type {type(data)} is not in the GFA standard") from exc
 
 
-def supplementary_datas(datas: list, length_condition: int) -> dict:
+def supplementary_datas(datas: list, length_condition: int, out: dict | None = None) -> dict:
     """Computes the optional tags of a gfa line and returns them as a dict
 
     Args:
         datas (list): parsed data line
         length_condition (int): last position of positional field
+        out (dict | None, optional): a dict to fill in place with the tags. Defaults to None (a new dict).
 
     Returns:
         dict: mapping tag:value
     """
-    mapping: dict = dict()
+    mapping: dict = dict() if out is None else out
     nargs: int = length_condition
     if len(datas) > length_condition:  # we happen to have additional tags to our line
         for additional_tag in datas[length_condition:]:
-            if match('[A-Z]{2}:[a-zA-Z]{1}:', additional_tag):  # matches start of the line
+            # matches start of the line, equivalent to '[A-Z]{2}:[a-zA-Z]{1}:'
+            if len(additional_tag) > 4 and additional_tag[2] == ':' and additional_tag[4] == ':' and additional_tag[0] in _TAG_NAME_CHARS and additional_tag[1] in _TAG_NAME_CHARS and additional_tag[3] in _TAG_TYPE_CHARS:
                 mapping[additional_tag[:2]] = gtype(
                     additional_tag[3])(additional_tag[5:])
             else:
@@ -145,6 +165,25 @@ def supplementary_datas(datas: list, length_condition: int) -> dict:
     return mapping
 
 
+def read_lines(gfa_reader, block_size: int = _READ_BLOCK_SIZE) -> Iterator[str]:
+    """Reads a text stream by large blocks, and yields its lines one by one
+
+    Args:
+        gfa_reader (TextIO): an opened text file
+        block_size (int, optional): number of chars read at once. Defaults to 1 MiB.
+
+    Yields:
+        str: a line of the file, without its trailing newline
+    """
+    remainder: str = ''
+    while (block := gfa_reader.read(block_size)):
+        lines: list[str] = (remainder + block).split('\n')
+        remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
+
+
 class Orientation(Enum):
     "Describes the way a node is read"
     FORWARD = '+'
@@ -152,6 +191,16 @@ class Orientation(Enum):
     UNKNOWN = '?'
 
 
+# Direct lookups from GFA orientation chars, cheaper than calling Orientation()
+_ORI_CHAR: dict[str, Orientation] = {
+    orientation.value: orientation for orientation in Orientation}
+# Chars used to write orientations back, in P-lines and W-lines
+_P_CHAR: dict[Orientation, str] = {
+    Orientation.FORWARD: '+', Orientation.REVERSE: '-', Orientation.UNKNOWN: '-'}
+_W_CHAR: dict[Orientation, str] = {
+    Orientation.FORWARD: '>', Orientation.REVERSE: '<', Orientation.UNKNOWN: '<'}
+
+
 class GfaStyle(Enum):
     "Describes the different possible formats"
     RGFA = 'rGFA'
@@ -162,29 +211,11 @@ class GfaStyle(Enum):
     UNK = 'unknown'
 
 
-class LineType():
-    "Modelizes the line type in GFA format by the meaning of first char of sequence"
-    __slots__ = ['type', 'func']
-
-    def __init__(self, key: str) -> None:
-        default_value: tuple = (default, Other)
-        mapping: dict = {
-            'H': (header, Header),
-            'S': (segment, Segment),
-            'L': (line, Line),
-            'C': (containment, Containment),
-            'P': (path, Path),
-            'W': (walk, Walk),
-            'J': (jump, Jump)
-        }
-        self.func, self.type = mapping.get(key, default_value)
-
-
 class Header():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
     def __str__(self) -> str:
         return '\t'.join([f"{key}:{dtype(value)}:{value}" for key, value in self.datas.items()])
@@ -195,9 +226,9 @@ class Header():
 
 class Segment():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
     def __init__(self, name: str, seq: str, **kwargs) -> None:
         self.datas: dict = {'name': name, 'seq': seq, **kwargs}
@@ -211,9 +242,9 @@ class Segment():
 
 class Line():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
     def __init__(self, start: str, ori_start: str, end: str, ori_end: str, **kwargs) -> None:
         self.datas: dict = {'start': start, 'end': end,
@@ -229,16 +260,16 @@ class Line():
 
 class Containment():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
 
 class Path():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
     def __init__(self, name: str, chain: list[tuple], **kwargs) -> None:
         self.datas: dict = {'name': name, 'path': chain, **kwargs}
@@ -246,23 +277,39 @@ class Path():
 
 class Walk():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
 
 class Jump():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
 
 
 class Other():
     "Empty type to define linestyle"
+    __slots__ = ['datas', 'gfastyle']
     datas: dict
     gfastyle: GfaStyle
-    linetype: LineType
+
+
+# Any object built from a GFA line
+GfaRecord = Header | Segment | Line | Containment | Path | Walk | Jump | Other
+
+
+def _digits(name: str) -> str:
+    """Strips every non-digit char from a node name
+
+    Args:
+        name (str): a node name
+
+    Returns:
+        str: the digits of the name
+    """
+    return name if name.isdecimal() else ''.join(filter(str.isdecimal, name))
 
 
 def default(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -305,11 +352,45 @@ def segment(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
         dict: mapping tags:values
     """
     line_datas: dict = dict()
-    line_datas["name"] = sub('\D', '', datas[1])
+    names: dict = kwargs.get('names', {})
+    name: str = _digits(datas[1])
+    line_datas["name"] = names.setdefault(name, name)
     line_datas["length"] = len(datas[2])
     if kwargs['ws']:
         line_datas["seq"] = datas[2]
-    return {**line_datas, **supplementary_datas(datas, 3)}
+    return supplementary_datas(datas, 3, out=line_datas)
+
+
+def sequenceless_segment(gfa_data_line: str, gfa_style: GfaStyle, **kwargs) -> dict:
+    """Extracts the data from a segment line, without ever slicing its sequence out of the line.
+    Equivalent to segment() when sequence is not kept, but does not split the whole line.
+
+    Args:
+        gfa_data_line (str): raw GFA line, without trailing newline
+        gfa_style (GfaStyle): informations about gfa subformat
+
+    Returns:
+        dict: mapping tags:values
+    """
+    line_datas: dict = dict()
+    first_tab: int = gfa_data_line.find('\t')
+    second_tab: int = gfa_data_line.find('\t', first_tab+1)
+    if second_tab == -1:
+        # Line is missing its sequence field, we let segment() report it like in the other load mode
+        return segment(gfa_data_line.split('\t'), gfa_style, **(kwargs | {'ws': False}))
+    third_tab: int = gfa_data_line.find('\t', second_tab+1)
+    name: str = gfa_data_line[first_tab+1:second_tab]
+    node_name: str = _digits(name)
+    line_datas["name"] = kwargs.get('names', {}).setdefault(node_name, node_name)
+    if third_tab == -1:
+        # No optional tags after sequence
+        line_datas["length"] = len(gfa_data_line) - second_tab - 1
+        return line_datas
+    line_datas["length"] = third_tab - second_tab - 1
+    # Placeholders keep positional numbering of untagged fields (ARG3, ...)
+    datas: list = ['S', name, '']
+    datas.extend(gfa_data_line[third_tab+1:].split('\t'))
+    return supplementary_datas(datas, 3, out=line_datas)
 
 
 def line(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -323,10 +404,13 @@ def line(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
         dict: mapping tags:values
     """
     line_datas: dict = dict()
-    line_datas["start"] = sub('\D', '', datas[1])
-    line_datas["end"] = sub('\D', '', datas[3])
+    names: dict = kwargs.get('names', {})
+    start: str = _digits(datas[1])
+    end: str = _digits(datas[3])
+    line_datas["start"] = names.setdefault(start, start)
+    line_datas["end"] = names.setdefault(end, end)
     line_datas["orientation"] = f"{datas[2]}/{datas[4]}"
-    return {**line_datas, **supplementary_datas(datas, 5)}
+    return supplementary_datas(datas, 5, out=line_datas)
 
 
 def containment(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -360,14 +444,20 @@ def path(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
         raise ValueError(
             f"Incompatible version format, P-lines vere added in GFA1 and were absent from {gfa_style}.")
     line_datas["name"] = datas[1]
-    line_datas["path"] = [
-        (
-            node[:-1],
-            Orientation(node[-1])
-        )
-        for node in datas[2].split(',')
-    ]
-    return {**line_datas, **supplementary_datas(datas, 7)}
+    setdefault_name: Callable = kwargs.get('names', {}).setdefault
+    try:
+        line_datas["path"] = [
+            (
+                setdefault_name(step_name := node[:-1], step_name),
+                _ORI_CHAR[node[-1]]
+            )
+            for node in datas[2].split(',')
+        ]
+    except KeyError as exc:
+        # Same error as Orientation() on an unknown orientation char
+        raise ValueError(
+            f"{exc.args[0]!r} is not a valid {Orientation.__name__}") from exc
+    return supplementary_datas(datas, 7, out=line_datas)
 
 
 def walk(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
@@ -389,14 +479,18 @@ def walk(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
     line_datas["name"] = datas[1]
     line_datas["start_offset"] = datas[4]
     line_datas["stop_offset"] = datas[5]
+    if datas[6][:1] not in ('>', '<'):
+        raise ValueError(
+            f"Walk {datas[1]} does not start with an orientation char ('>' or '<').")
+    setdefault_name: Callable = kwargs.get('names', {}).setdefault
     line_datas["path"] = [
         (
-            node[1:],
-            Orientation(node[0])
+            setdefault_name(step_name := node[1:], step_name),
+            _ORI_CHAR[node[0]]
         )
         for node in datas[6].replace('>', ',+').replace('<', ',-')[1:].split(',')
     ]
-    return {**line_datas, **supplementary_datas(datas, 7)}
+    return supplementary_datas(datas, 7, out=line_datas)
 
 
 def jump(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -415,24 +509,59 @@ def jump(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
     return supplementary_datas(datas, 1)
 
 
-class Record():
+# Maps the first char of a GFA line to its parsing function and its linestyle
+_LINE_DISPATCH: dict = {
+    'H': (header, Header),
+    'S': (segment, Segment),
+    'L': (line, Line),
+    'C': (containment, Containment),
+    'P': (path, Path),
+    'W': (walk, Walk),
+    'J': (jump, Jump)
+}
+_DEFAULT_DISPATCH: tuple = (default, Other)
+
+
+def make_record(gfa_data_line: str, gfa_style: GfaStyle, kwargs: dict = {}) -> GfaRecord:
+    """Parses a GFA line, and builds directly the object of the matching linestyle
+
+    Args:
+        gfa_data_line (str): a line of a GFA file
+        gfa_style (GfaStyle): informations about gfa subformat
+        kwargs (dict, optional): options given to the line parser. Defaults to {}.
+
+    Returns:
+        GfaRecord: the parsed line
+    """
+    func, linestyle = _LINE_DISPATCH.get(
+        gfa_data_line[0], _DEFAULT_DISPATCH)
+    # We bypass __init__ of linestyles, which are made to create new objects from scratch
+    record = linestyle.__new__(linestyle)
+    record.gfastyle = gfa_style
+    if linestyle is Segment and not kwargs.get('ws', False):
+        # Sequence won't be kept, so we avoid splitting it out of the line
+        record.datas = sequenceless_segment(
+            gfa_data_line.strip('\n'), gfa_style, **kwargs)
+    else:
+        datas: list = gfa_data_line.strip('\n').split('\t')
+        record.datas = func(datas, gfa_style, **kwargs)
+    return record
+
+
+class Record(metaclass=ABCMeta):
     """
     Modelizes a GFA line
+    Kept for compatibility: calling it returns the object built by make_record()
+    Linestyles are registered as its virtual subclasses, so isinstance(record, Record) still holds
     """
-    __slots__ = ['gfastyle', 'linetype', 'datas', '__class__']
 
-    def __init__(self, gfa_data_line: str, gfa_type: str, kwargs: dict = {}) -> None:
-        datas: list = gfa_data_line.strip('\n').split('\t')
-        self.gfastyle: GfaStyle = GfaStyle(gfa_type)
-        self.linetype: LineType = LineType(gfa_data_line[0])
-        self.datas: dict = self.linetype.func(datas, self.gfastyle, **kwargs)
-        self.__class__ = self.linetype.type
+    def __new__(cls, gfa_data_line: str, gfa_type: str, kwargs: dict = {}) -> GfaRecord:
+        return make_record(gfa_data_line, GfaStyle(gfa_type), kwargs)
 
-    def __str__(self) -> str:
-        return "RawRecord()"
 
-    def __repr__(self) -> str:
-        return self.__str__()
+for linestyle in (Header, Segment, Line, Containment, Path, Walk, Jump, Other):
+    Record.register(linestyle)
+del linestyle
 
 
 class Graph():
@@ -440,7 +569,8 @@ class Graph():
     Modelizes a GFA graph
     """
     __slots__ = ['version', 'graph', 'headers', 'segments', 'mapping',
-                 'lines', 'containment', 'paths', 'walks', 'jumps', 'others', 'colors']
+                 'lines', 'containment', 'paths', 'walks', 'jumps', 'others', 'colors',
+                 '_seg_index', '_path_index', '_indexed_segments', '_indexed_paths', '_outdated_index']
 
     def __init__(self, gfa_file: str | None = None, gfa_type: str = 'unknown', with_sequence: bool = False) -> None:
         """Constructor for GFA Graph object.
@@ -475,7 +605,7 @@ class Graph():
                     "Specified file does not exists. Please check provided path."
                 )
             # Checking if file descriptor is valid
-            if not gfa_file.endswith('.gfa'):
+            if not gfa_file.endswith('.gfa') and not gfa_file.endswith('.gfa.gz'):
                 raise IOError(
                     "File descriptor is invalid. Please check format, this lib is designed to work with Graphical Fragment Assembly (GFA) files."
                 )
@@ -485,29 +615,46 @@ class Graph():
                     "File is empty."
                 )
 
+            # Each record goes to the list matching the first char of its line
+            buckets: dict[str, list] = {
+                'H': self.headers,
+                'S': self.segments,
+                'L': self.lines,
+                'C': self.containment,
+                'P': self.paths,
+                'W': self.walks,
+                'J': self.jumps
+            }
+            # Options given to the line parsers, shared by all records.
+            # A node name appears in its S-line, but also in every L-line and path step
+            # that goes through it: parsers pick names from this per-load dict, so all
+            # of them share one string object, freed along with the graph.
+            parse_options: dict = {'ws': with_sequence, 'names': {}}
+            # Local bindings, looked up once instead of once per line
+            get_bucket: Callable = buckets.get
+            others: list[Other] = self.others
             # All lines shall start by a captial letter (see GFAspec). If not, we raise ValueError
-            with open(gfa_file, 'r', encoding='utf-8') as gfa_reader:
-                for gfa_line in gfa_reader:
-
-                    if not gfa_line[0].isupper() and len(gfa_line.strip()) != 0:
+            with open(gfa_file, 'r', encoding='utf-8') if gfa_file.endswith('.gfa') else gz_open(gfa_file, 'rt', encoding='utf-8') as gfa_reader:
+                for gfa_line in read_lines(gfa_reader):
+                    # Empty lines do not describe anything
+                    if not gfa_line:
+                        continue
+                    line_type: str = gfa_line[0]
+                    if not line_type.isupper() and len(gfa_line.strip()) != 0:
                         raise ValueError(
                             "All GFA lines shall start with a capital letter. Wrong format, please fix."
                         )
                     # We parse the GFA line with the record class
-                    record: Record = Record(
+                    record: GfaRecord = make_record(
                         gfa_line,
-                        self.version.value,
-                        {
-                            'ws': with_sequence
-                        }
+                        self.version,
+                        parse_options
                     )
                     # We put record in the right list
-                    if isinstance(record, Header):
-                        self.headers.append(record)
+                    get_bucket(line_type, others).append(record)
+                    if line_type == 'H':
                         try:
-                            version_number: str = supplementary_datas(
-                                gfa_line.strip('\n').split('\t'), 1
-                            )["VN"]
+                            version_number: str = record.datas["VN"]
                             if version_number == '1.0':
                                 self.version = GfaStyle('GFA1')
                             elif version_number == '1.1':
@@ -520,23 +667,10 @@ class Graph():
                                 self.version = GfaStyle('unknown')
                         except KeyError:
                             self.version = GfaStyle('rGFA')
-                    elif isinstance(record, Segment):
-                        self.segments.append(record)
-                    elif isinstance(record, Line):
-                        self.lines.append(record)
-                    elif isinstance(record, Containment):
-                        self.containment.append(record)
-                    elif isinstance(record, Path):
-                        self.paths.append(record)
-                    elif isinstance(record, Walk):
-                        self.walks.append(record)
-                    elif isinstance(record, Jump):
-                        self.jumps.append(record)
-                    else:
-                        self.others.append(record)
             # Checking GFA style
         self.mapping: dict = {
-            node.datas["name"]: node.datas["seq"] for node in self.segments}
+            node.datas["name"]: node.datas["seq"] for node in self.segments if "seq" in node.datas}
+        self.reindex()
 
     def __str__(self) -> str:
         return f"GFA Graph object (version {self.version.value}) containing {len(self.segments)} segments, {len(self.lines)} edges and {len(self.paths)+len(self.walks)} paths."
@@ -549,14 +683,48 @@ class Graph():
         """
         return self.mapping[name]
 
+    def reindex(self) -> None:
+        """Rebuilds the lookup tables used to find segments and paths by name.
+        Edition methods of the graph either keep them up to date or mark them as outdated,
+        so they are rebuilt once at next lookup instead of after each edition.
+        Lookups also rebuild them when the segments, paths or walks lists changed size.
+        A name given by hand to an earlier segment or path than the indexed one is not
+        seen: this must be called after renaming elements of these lists by hand.
+        """
+        self._seg_index: dict[str, int] = dict()
+        for i, seg in enumerate(self.segments):
+            self._seg_index.setdefault(seg.datas["name"], i)
+        self._indexed_segments: int = len(self.segments)
+        # Paths are indexed by (is_walk, position in self.paths or self.walks)
+        self._path_index: dict[str, tuple[bool, int]] = dict()
+        for i, gpath in enumerate(self.paths):
+            self._path_index.setdefault(gpath.datas["name"], (False, i))
+        for i, gpath in enumerate(self.walks):
+            self._path_index.setdefault(gpath.datas["name"], (True, i))
+        self._indexed_paths: tuple[int, int] = (
+            len(self.paths), len(self.walks))
+        self._outdated_index: bool = False
+
     def add_node(self, name: str, sequence: str) -> None:
         self.segments.append(Segment(name, sequence))
+        if self._outdated_index or self._indexed_segments != len(self.segments)-1:
+            self._outdated_index = True
+            return
+        self._seg_index.setdefault(name, len(self.segments)-1)
+        self._indexed_segments += 1
 
     def add_edge(self, source, ori_source, sink, ori_sink) -> None:
         self.lines.append(Line(source, ori_source, sink, ori_sink))
 
     def add_path(self, name, chain) -> None:
         self.paths.append(Path(name, chain))
+        if self._outdated_index or self._indexed_paths != (len(self.paths)-1, len(self.walks)):
+            self._outdated_index = True
+            return
+        # P-lines come before W-lines when searching a path by name
+        if name not in self._path_index or self._path_index[name][0]:
+            self._path_index[name] = (False, len(self.paths)-1)
+        self._indexed_paths = (len(self.paths), len(self.walks))
 
     def split_segments(self, segment_name: str, future_segment_name: str | list, position_to_split: tuple | list) -> None:
         """Given a segment to split and a series/single new name(s) + position(s),
@@ -622,28 +790,42 @@ class Graph():
             except IndexError:
                 pass
 
-        # Add to paths by inserting after node to be splitted
+        # Add to paths by replacing node to be splitted with the new nodes
+        replacement: list[tuple] = [(nname, Orientation(
+            orient)) for nname in future_segment_name]
         for ipath in self.get_path_list():
-            edited: bool = False
-            for posx, sparkl in enumerate(ipath.datas['path']):
-                node, _ = sparkl
-                if node == segment_name and not edited:
-                    edited = True
-                    ipath.datas['path'].remove(sparkl)
-                    ipath.datas['path'][posx:posx] = [(nname, Orientation(
-                        orient)) for nname in future_segment_name]
+            hits: list[int] = [posx for posx, (node, _) in enumerate(
+                ipath.datas['path']) if node == segment_name]
+            if not hits:
+                continue
+            # Path is rebuilt once, instead of being edited while iterating over it
+            new_path: list[tuple] = list()
+            previous: int = 0
+            for posx in hits:
+                new_path.extend(ipath.datas['path'][previous:posx])
+                new_path.extend(replacement)
+                previous = posx + 1
+            new_path.extend(ipath.datas['path'][previous:])
+            ipath.datas['path'] = new_path
+        self._outdated_index = True
 
     def rename_node(self, old_name: str, new_name: str, edit_paths: bool = True) -> Segment | None:
         "Performs node name edition operation on graph"
         new_name = str(new_name)
         old_name = str(old_name)
         try:
-            to_edit: Segment = self.get_segment(old_name)
+            position: int = self.get_segment_position(old_name)
         except ValueError:
             print(f"Node {old_name} not found.")
             return None
         # Changing the name of the node
+        to_edit: Segment = self.segments[position]
         to_edit.datas['name'] = new_name
+        # Lookup table is updated in place, as positions do not change
+        if self._seg_index.get(old_name) == position:
+            del self._seg_index[old_name]
+        if self._seg_index.get(new_name, position) >= position:
+            self._seg_index[new_name] = position
         # Changing the name inside edges
         edges_to_edit: list = self.get_edges(old_name)
         for e in edges_to_edit:
@@ -685,9 +867,18 @@ class Graph():
             left_most.datas['seq'] = ''.join(
                 [self.segments[i].datas['seq'] for i in segments_positions])
 
+        # Edges of merged nodes are collected in a single pass over all edges
+        merged_edges: dict[str, list[int]] = {
+            self.segments[node_pos].datas['name']: [] for node_pos in segments_positions[1:]}
+        for edge_pos, edge in enumerate(self.lines):
+            if edge.datas['start'] in merged_edges:
+                merged_edges[edge.datas['start']].append(edge_pos)
+            if edge.datas['end'] != edge.datas['start'] and edge.datas['end'] in merged_edges:
+                merged_edges[edge.datas['end']].append(edge_pos)
+
         # Find anchors for last node, and replicates it for first node
-        edges_to_edit = self.get_edges_positions(
-            right_most_name := right_most.datas['name'])
+        edges_to_edit: list[int] = merged_edges.get(
+            right_most_name := right_most.datas['name'], [])
         left_most_name: str = left_most.datas['name']
         for edge_pos in edges_to_edit:
             if self.lines[edge_pos].datas['start'] == right_most_name:
@@ -695,8 +886,8 @@ class Graph():
             else:
                 self.lines[edge_pos].datas['end'] = left_most_name
 
-        edges_to_delete = list(chain(*[self.get_edges_positions(
-            self.segments[node_pos].datas['name']) for node_pos in segments_positions[1:-1]]))
+        edges_to_delete: set[int] = {edge_pos for node_pos in segments_positions[1:-1]
+                                     for edge_pos in merged_edges[self.segments[node_pos].datas['name']]}
 
         # Edit the paths by iterating over all paths
         # We assert position matching, and we reverse the ordering to edit without destrying info
@@ -710,16 +901,14 @@ class Graph():
                 ipath.datas['path'] = ipath.datas['path'][:pos-1] + [(left_most_name, ipath.datas['path'][pos][1])] +\
                     ipath.datas['path'][pos+len(names_to_be_deleted):]
 
-        # Delete nodes and edges that are not relevant anymore
+        # Delete nodes and edges that are not relevant anymore, in a single pass per list
+        segments_to_delete: set[int] = set(segments_positions[1:])
         self.segments = [seg for i, seg in enumerate(
-            self.segments) if i not in segments_positions[1:]]
+            self.segments) if i not in segments_to_delete]
+        # Cleaning edges that became self-loops at the same time
         self.lines = [lin for i, lin in enumerate(
-            self.lines) if i not in edges_to_delete]
-
-        # Cleaning
-        for sline in self.lines:
-            if sline.datas['start'] == sline.datas['end']:
-                self.lines.remove(sline)
+            self.lines) if i not in edges_to_delete and lin.datas['start'] != lin.datas['end']]
+        self._outdated_index = True
 
         return left_most_name
 
@@ -735,20 +924,17 @@ class Graph():
         Returns:
             Segment: the line describing the node
         """
-        node = str(node)
-        for seg in self.segments:
-            if seg.datas["name"] == node:
-                return seg
-        raise ValueError(f"Node {node} is not in graph.")
+        return self.segments[self.get_segment_position(node)]
 
     def remove_duplicates_segments(self) -> None:
         """Search for all nodes that are duplicates of each other, and keeps only one instance per node name"""
         # Cleaning node names
         for seg in self.segments:
-            seg.datas["name"] = sub('\D', '', seg.datas["name"])
+            seg.datas["name"] = _digits(seg.datas["name"])
         # Purging duplicate values
         self.segments = list(
             {fseg.datas['name']: fseg for fseg in self.segments}.values())
+        self._outdated_index = True
 
     def remove_duplicates_edges(self) -> None:
         """Search for all nodes that are duplicates of each other, and keeps only one instance per node name"""
@@ -758,8 +944,9 @@ class Graph():
             {f"{fedg.datas['start']}_{fedg.datas['end']}": fedg for fedg in self.lines if fedg.datas['end'] != fedg.datas['start'] and fedg.datas['end'] in set_of_nodes and fedg.datas['start'] in set_of_nodes}.values())
         # Cleaning edge names
         for edg in self.lines:
-            edg.datas["start"] = sub('\D', '', edg.datas["start"])
-            edg.datas["end"] = sub('\D', '', edg.datas["end"])
+            edg.datas["start"] = _digits(edg.datas["start"])
+            edg.datas["end"] = _digits(edg.datas["end"])
+        self._outdated_index = True
 
     def duplicate_segments(self, ntimes: int = 1):
         "Duplicate graph segments"
@@ -767,6 +954,7 @@ class Graph():
         for _ in range(ntimes):
             duplicates += deepcopy(self.segments)
         self.segments += duplicates
+        self._outdated_index = True
 
     def get_segments_by_id(self, node: str | int) -> list[Segment]:
         """Search the node with the corresponding node name inside the graph, and returns it.
@@ -780,7 +968,7 @@ class Graph():
         node = str(node)
         matching_segments: list = list()
         for seg in self.segments:
-            if sub('\D', '', seg.datas["name"]) == str(node):
+            if _digits(seg.datas["name"]) == str(node):
                 matching_segments.append(seg)
         return matching_segments
 
@@ -797,8 +985,18 @@ class Graph():
             Segment: the line describing the node
         """
         node = str(node)
+        if self._outdated_index or self._indexed_segments != len(self.segments):
+            self.reindex()
+        position: int | None = self._seg_index.get(node)
+        if position is not None:
+            if self.segments[position].datas["name"] == node:
+                return position
+            # Segment has been renamed by hand, index will be rebuilt at next lookup
+            self._outdated_index = True
+        # Name is not indexed: either absent, or given to a segment by hand
         for i, seg in enumerate(self.segments):
             if seg.datas["name"] == node:
+                self._outdated_index = True
                 return i
         raise ValueError(f"Node {node} is not in graph.")
 
@@ -822,8 +1020,19 @@ class Graph():
         Returns:
             Path | Walk: the required path
         """
+        if self._outdated_index or self._indexed_paths != (len(self.paths), len(self.walks)):
+            self.reindex()
+        if name in self._path_index:
+            is_walk, position = self._path_index[name]
+            gpath: Path | Walk = self.walks[position] if is_walk else self.paths[position]
+            if gpath.datas["name"] == name:
+                return gpath
+            # Path has been renamed by hand, index will be rebuilt at next lookup
+            self._outdated_index = True
+        # Name is not indexed: either absent, or given to a path by hand
         for gpath in self.get_path_list():
             if gpath.datas["name"] == name:
+                self._outdated_index = True
                 return gpath
         raise ValueError(
             f"Specified name {name} does not define a path in your GFA file.")
@@ -921,7 +1130,12 @@ class Graph():
         self.colors = {f"bp{bound_low}-{bound_high}": node_palette[i]
                        for i, (bound_low, bound_high) in enumerate(node_size_classes)}
         node_prefix = f"{node_prefix}_" if node_prefix is not None else ""
+        # Size class of a node only depends on its length, so we compute it once per length
+        color_by_length: dict[int, str] = dict()
         for node in self.segments:
+            if (node_length := node.datas["length"]) not in color_by_length:
+                color_by_length[node_length] = node_palette[[index for index, (low_limit, high_limit) in enumerate(
+                    node_size_classes) if node_length >= low_limit and node_length <= high_limit][0]]
             node_title: list = []
             for key, val in node.datas.items():
                 if isinstance(val, dict):
@@ -931,8 +1145,7 @@ class Graph():
             self.graph.add_node(
                 f"{node_prefix}{node.datas['name']}",
                 title='\n'.join(node_title),
-                color=node_palette[[index for index, (low_limit, high_limit) in enumerate(
-                    node_size_classes) if node.datas["length"] >= low_limit and node.datas["length"] <= high_limit][0]],
+                color=color_by_length[node_length],
                 size=10,
                 offsets=node.datas['PO'] if 'PO' in node.datas else None,
                 sequence=node.datas.get('seq', '')
@@ -940,23 +1153,20 @@ class Graph():
         palette: list = get_palette(
             len(path_list := self.get_path_list()), as_hex=True)
 
-        self.colors = {**self.colors, **{p.datas["name"]: palette[i]
-                       for i, p in enumerate(path_list)}}
+        self.colors.update({p.datas["name"]: palette[i]
+                           for i, p in enumerate(path_list)})
         if len(path_list) > 0:
-            visited_paths: int = 0
-            for visited_path in path_list:
-                for i in range(len(visited_path.datas["path"])-1):
-                    left_node, left_orient = visited_path.datas["path"][i]
-                    right_node, right_orient = visited_path.datas["path"][i+1]
+            for visited_paths, visited_path in enumerate(path_list):
+                path_title: str = str(visited_path.datas["name"])
+                for (left_node, left_orient), (right_node, right_orient) in pairwise(visited_path.datas["path"]):
                     self.graph.add_edge(
                         f"{node_prefix}{left_node}",
                         f"{node_prefix}{right_node}",
-                        title=str(visited_path.datas["name"]),
+                        title=path_title,
                         color=palette[visited_paths],
                         label=f"{left_orient.value}/{right_orient.value}",
                         weight=3
                     )
-                visited_paths += 1
         else:
             for edge in self.lines:
                 self.graph.add_edge(
@@ -977,26 +1187,27 @@ class Graph():
                 if None, default graph format will be used.
         """
         output_format = output_format or self.version
-        line_number: int = 0
-        with open(output_path, 'w', encoding='utf-8') as gfa_writer:
+
+        def gfa_lines() -> Iterator[str]:
+            "Yields the lines of the output file, in order"
             if self.headers and output_format != GfaStyle.RGFA:
                 for head in self.headers:
-                    gfa_writer.write(
-                        "H\t"+'\t'.join([f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in head.datas.items()])+"\n")
-            if self.segments:
-                for seg in self.segments:
-                    gfa_writer.write("S\t"+f"{seg.datas['name']}\t{seg.datas['seq'] if 'seq' in seg.datas else 'N'*seg.datas['length']}\t" + '\t'.join(
-                        [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in seg.datas.items() if key not in ['length', 'seq', 'name']])+"\n")
-            if self.lines:
-                for lin in self.lines:
-                    ori1, ori2 = lin.datas['orientation'].split('/')
-                    gfa_writer.write(f"L\t"+f"{lin.datas['start']}\t{ori1}\t{lin.datas['end']}\t{ori2}\t" + '\t'.join(
-                        [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in lin.datas.items() if key not in ['orientation', 'start', 'end']])+"\n")
-            if self.get_path_list():
-                for pathl in self.get_path_list():
-                    gfa_writer.write(
-                        f"{write_path(pathl,output_format,line_number)}")
-                    line_number += 1
+                    yield "H\t"+'\t'.join([f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in head.datas.items()])+"\n"
+            for seg in self.segments:
+                yield "S\t"+f"{seg.datas['name']}\t{seg.datas['seq'] if 'seq' in seg.datas else 'N'*seg.datas['length']}\t" + '\t'.join(
+                    [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in seg.datas.items() if key not in ['length', 'seq', 'name']])+"\n"
+            for lin in self.lines:
+                ori1, ori2 = lin.datas['orientation'].split('/')
+                yield f"L\t"+f"{lin.datas['start']}\t{ori1}\t{lin.datas['end']}\t{ori2}\t" + '\t'.join(
+                    [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in lin.datas.items() if key not in ['orientation', 'start', 'end']])+"\n"
+            for line_number, pathl in enumerate(self.get_path_list()):
+                yield write_path(pathl, output_format, line_number)
+
+        # Lines are handed to the writer by batches, through a large buffer
+        output_lines: Iterator[str] = gfa_lines()
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as gfa_writer:
+            while (batch := list(islice(output_lines, _WRITE_BATCH_SIZE))):
+                gfa_writer.writelines(batch)
 
 
 def write_path(way: Walk | Path, gfa_format: GfaStyle, line_number: int) -> str:
@@ -1011,7 +1222,7 @@ def write_path(way: Walk | Path, gfa_format: GfaStyle, line_number: int) -> str:
     """
     if gfa_format == GfaStyle.GFA1:  # P-line
         strpath: str = ','.join(
-            [f"{node_name}{'+' if orient == Orientation.FORWARD else '-'}" for node_name, orient in way.datas['path']])
+            [f"{node_name}{_P_CHAR.get(orient, '-')}" for node_name, orient in way.datas['path']])
 
         return f"P\t{way.datas['name']}\t{strpath}\t*"
 
@@ -1020,5 +1231,5 @@ def write_path(way: Walk | Path, gfa_format: GfaStyle, line_number: int) -> str:
         offset_start: int | str = way.datas['start_offset'] if 'start_offset' in way.datas else '?'
         offset_stop: int | str = way.datas['stop_offset'] if 'stop_offset' in way.datas else '?'
         strpath: str = ''.join(
-            [f"{'>' if orient == Orientation.FORWARD else '<'}{node_name}" for node_name, orient in way.datas['path']])
+            [f"{_W_CHAR.get(orient, '<')}{node_name}" for node_name, orient in way.datas['path']])
         return f"W\t{way.datas['name']}\t{way.datas['origin'] if 'origin' in way.datas else line_number}\t{way.datas['name']}\t{offset_start}\t{offset_stop}\t{strpath}\t*\n"